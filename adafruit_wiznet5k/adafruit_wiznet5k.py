@@ -48,6 +48,7 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Wiznet5k.git"
 
 from random import randint
+import struct
 import time
 import gc
 from micropython import const
@@ -81,6 +82,8 @@ _REG_LINK_FLAG = {
 }
 _REG_RCR = {"w5100s": const(0x0019), "w5500": const(0x001B), "w6100": const(0x4204)}
 _REG_RTR = {"w5100s": const(0x0017), "w5500": const(0x0019), "w6100": const(0x4200)}
+# Socket interrupt mask (IMR for 5100s).
+_REG_SIMR = {"w5100s": const(0x0016), "w5500": const(0x0018), "w6100": const(0x2114)}
 
 # *** Wiznet Socket Registers ***
 # Socket n Mode.
@@ -89,6 +92,12 @@ _REG_SNMR = const(0x0000)
 _REG_SNCR = {"w5100s": const(0x0001), "w5500": const(0x0001), "w6100": const(0x0010)}
 # Socket n Interrupt.
 _REG_SNIR = {"w5100s": const(0x0002), "w5500": const(0x0002), "w6100": const(0x0020)}
+# Socket n Interrupt Clear, the W6100 Sn_IR is read only.
+_REG_SNIRCLR = {
+    "w5100s": const(0x0002),
+    "w5500": const(0x0002),
+    "w6100": const(0x0028),
+}
 # Socket n Status.
 _REG_SNSR = {"w5100s": const(0x0003), "w5500": const(0x0003), "w6100": const(0x0030)}
 # Socket n Source Port.
@@ -113,6 +122,8 @@ _REG_SNTX_FSR = {
 }
 # TX Write Pointer.
 _REG_SNTX_WR = {"w5100s": const(0x0024), "w5500": const(0x0024), "w6100": const(0x020C)}
+# Socket n Interrupt Mask.
+_REG_SNIMR = {"w5100s": const(0x002C), "w5500": const(0x002C), "w6100": const(0x0024)}
 
 # SNSR Commands
 SNSR_SOCK_CLOSED = const(0x00)
@@ -130,6 +141,16 @@ _SNSR_SOCK_UDP = const(0x22)
 _SNSR_SOCK_IPRAW = const(0x32)
 _SNSR_SOCK_MACRAW = const(0x42)
 _SNSR_SOCK_PPPOE = const(0x5F)
+# Socket states checked while polling, built once rather than on every iteration.
+_SNSR_LISTEN_READY = (SNSR_SOCK_LISTEN, SNSR_SOCK_ESTABLISHED, _SNSR_SOCK_UDP)
+_SNSR_WRITABLE = (SNSR_SOCK_ESTABLISHED, SNSR_SOCK_CLOSE_WAIT)
+_SNSR_SEND_CLOSED = (
+    SNSR_SOCK_CLOSED,
+    SNSR_SOCK_TIME_WAIT,
+    SNSR_SOCK_FIN_WAIT,
+    SNSR_SOCK_CLOSE_WAIT,
+    _SNSR_SOCK_CLOSING,
+)
 
 # Sock Commands (CMD)
 _CMD_SOCK_OPEN = const(0x01)
@@ -152,6 +173,10 @@ _SNIR_CON = const(0x01)
 _CH_SIZE = const(0x100)
 _SOCK_SIZE = const(0x800)  # MAX W5k socket size
 _SOCK_MASK = const(0x7FF)
+# Read RX data is released to the chip once 3/4 of the socket buffer is waiting.
+_RX_RELEASE_SIZE = const(0x600)
+# Unsent TX data is sent once 3/4 of the socket buffer is waiting.
+_TX_FLUSH_SIZE = const(0x600)
 # Register commands
 _MR_RST = const(0x80)  # Mode Register RST
 # Socket mode register
@@ -163,10 +188,17 @@ _SNMR_MACRAW = const(0x04)
 _SNMR_PPPOE = const(0x05)
 
 _MAX_PACKET = const(4000)
+# Longest wait for the INT pin before polling the socket registers over SPI.
+_IRQ_WAIT_NS = const(5000000)
+# SPI clock used for the chip, SPI mode 0.
+_SPI_BAUDRATE = const(8000000)
 _LOCAL_PORT = const(0x400)
 # Default hardware MAC address
 _DEFAULT_MAC = "DE:AD:BE:EF:FE:ED"
 
+# Seconds a link up reading is trusted by socket operations.
+_LINK_STATUS_TIMEOUT = 0.1
+
 # Maximum number of sockets to support, differs between chip versions.
 _MAX_SOCK_NUM = {"w5100s": const(0x04), "w5500": const(0x08), "w6100": const(0x08)}
 _SOCKET_INVALID = const(0xFF)
@@ -180,6 +212,78 @@ def _unprettyfy(data: str, seperator: str, correct_length: int) -> bytes:
     raise ValueError("Invalid IP or MAC address.")
 
 
+class _SPIFrame:  # pylint: disable=unnecessary-dunder-call
+    """
+    Chip select framing on top of an SPIDevice.
+
+    Each ``with`` block is one SPI frame. Outside a batch the frame is a full
+    SPIDevice transaction, inside a batch the bus is already locked and configured
+    so only chip select is toggled.
+    """
+
+    def __init__(
+        self,
+        device: SPIDevice,
+        spi_bus: busio.SPI,
+        chip_select: digitalio.DigitalInOut,
+    ) -> None:
+        self._device = device
+        self._spi_bus = spi_bus
+        self._cs = chip_select
+        self._spi = None
+        self._batch_depth = 0
+
+    def __enter__(self) -> busio.SPI:
+        if self._spi is None:
+            return self._device.__enter__()
+        self._cs.value = False
+        return self._spi
+
+    def __exit__(self, *exc_info) -> bool:
+        if self._spi is None:
+            return self._device.__exit__(*exc_info)
+        self._cs.value = True
+        return False
+
+    def start_batch(self) -> None:
+        """Lock the SPI bus until the matching end_batch() call."""
+        if not self._batch_depth:
+            # Lock and configure the bus with the same settings as the SPIDevice,
+            # leaving chip select to each frame in the batch.
+            spi = self._spi_bus
+            while not spi.try_lock():
+                pass
+            try:
+                spi.configure(baudrate=_SPI_BAUDRATE, polarity=0, phase=0)
+            except Exception:
+                spi.unlock()
+                raise
+            self._spi = spi
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """Release the SPI bus once the outermost batch ends."""
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self._spi.unlock()
+            self._spi = None
+
+
+class _SPIBatch:
+    """Context manager returned by WIZNET5K.batch()."""
+
+    def __init__(self, spi_frame: _SPIFrame) -> None:
+        self._spi_frame = spi_frame
+
+    def __enter__(self) -> _SPIBatch:
+        self._spi_frame.start_batch()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        self._spi_frame.end_batch()
+        return False
+
+
 class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-attributes
     """Interface for WIZNET5K module."""
 
@@ -199,6 +303,7 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         mac: Union[MacAddressRaw, str] = _DEFAULT_MAC,
         hostname: Optional[str] = None,
         debug: bool = False,
+        irq: Optional[digitalio.DigitalInOut] = None,
     ) -> None:
         """
         :param busio.SPI spi_bus: The SPI bus the Wiznet module is connected to.
@@ -210,12 +315,24 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         :param str hostname: The desired hostname, with optional {} to fill in the MAC
             address, defaults to None.
         :param bool debug: Enable debugging output, defaults to False.
+        :param digitalio.DigitalInOut irq: Optional pin connected to the chip's INT
+            output, defaults to None. If set, socket writes wait for the interrupt
+            instead of polling the socket interrupt register over SPI. INT is shared
+            by all sockets, so a pending interrupt on another socket ends the wait
+            early and the write falls back to polling.
         """
         self._debug = debug
         self._chip_type = None
-        self._device = SPIDevice(spi_bus, cs, baudrate=8000000, polarity=0, phase=0)
+        self._device = SPIDevice(
+            spi_bus, cs, baudrate=_SPI_BAUDRATE, polarity=0, phase=0
+        )
         # init c.s.
         self._cs = cs
+        self._spi_frame = _SPIFrame(self._device, spi_bus, cs)
+        self._batch = _SPIBatch(self._spi_frame)
+        self._irq = irq
+        if irq:
+            irq.switch_to_input()
 
         # Reset wiznet module prior to initialization.
         if reset:
@@ -234,10 +351,29 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         # Buffer for reading params from module
         self._pbuff = bytearray(8)
         self._rxbuf = bytearray(_MAX_PACKET)
+        # SPI frame header, with room for one byte of data.
+        self._cmd_buf = bytearray(4)
+        # Scratch buffers for one, two, four and six byte registers.
+        self._buf1 = bytearray(1)
+        self._buf2 = bytearray(2)
+        self._buf4 = bytearray(4)
+        self._buf6 = bytearray(6)
 
         # attempt to initialize the module
         self._ch_base_msb = 0
+        # Per-socket register base addresses and read / write control bytes.
+        self._sock_base = ()
+        self._sock_rctl = ()
+        self._sock_wctl = ()
         self._src_ports_in_use = []
+        # Bytes read from each socket's RX buffer but not yet released to the chip.
+        self._rx_pending = []
+        # Bytes written to each socket's TX buffer but not yet sent.
+        self._tx_pending = []
+        # Bit n is set while socket n is known to be closed.
+        self._sock_free_mask = 0
+        # When the link was last read as up.
+        self._link_up_time = None
         self._wiznet_chip_init()
 
         # Set MAC address
@@ -283,6 +419,19 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
             self._dhcp_client = None
             raise RuntimeError("Failed to configure DHCP Server!")
 
+    def batch(self) -> _SPIBatch:
+        """
+        Hold the SPI bus for a group of register operations.
+
+        Use as ``with wiznet.batch():``. Inside the block each register access
+        only toggles chip select instead of locking and configuring the SPI bus.
+        Batches may be nested. Other devices on the same SPI bus must not be
+        used inside the block.
+
+        :return _SPIBatch: A context manager holding the SPI bus.
+        """
+        return self._batch
+
     def maintain_dhcp_lease(self) -> None:
         """Maintain the DHCP lease."""
         if self._dhcp_client:
@@ -351,7 +500,7 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         """
         if len(ipv4) != 4:
             raise ValueError("Wrong length for IPv4 address.")
-        return ".".join(f"{byte}" for byte in ipv4)
+        return "{}.{}.{}.{}".format(*ipv4)
 
     @staticmethod
     def unpretty_ip(ipv4: str) -> bytes:
@@ -410,7 +559,7 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         """
         if len(mac) != 6:
             raise ValueError("Incorrect length for MAC address.")
-        return ":".join(f"{byte:02x}" for byte in mac)
+        return "{:02x}:{:02x}:{:02x}:{:02x}:{:02x}:{:02x}".format(*mac)
 
     def remote_ip(self, socket_num: int) -> str:
         """
@@ -423,11 +572,10 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         :raises ValueError: If the socket number is out of range.
         """
         self._sock_num_in_range(socket_num)
-        for octet in range(4):
-            self._pbuff[octet] = self._read_socket_register(
-                socket_num, _REG_SNDIPR[self._chip_type] + octet
-            )
-        return self.pretty_ip(self._pbuff[:4])
+        self._read_socket_registers(
+            socket_num, _REG_SNDIPR[self._chip_type], self._buf4
+        )
+        return self.pretty_ip(self._buf4)
 
     def remote_port(self, socket_num: int) -> int:
         """
@@ -451,10 +599,11 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
 
         :return bool: True if the link is up, False if the link is down.
         """
-        return bool(
-            int.from_bytes(self._read(_REG_LINK_FLAG[self._chip_type], 0x00), "big")
-            & 0x01
-        )
+        if self._read_byte(_REG_LINK_FLAG[self._chip_type], 0x00) & 0x01:
+            self._link_up_time = time.monotonic()
+            return True
+        self._link_up_time = None
+        return False
 
     @property
     def ifconfig(self) -> Tuple[bytes, bytes, bytes, bytes]:
@@ -464,10 +613,16 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         :return Tuple[bytes, bytes, bytes, bytes]: The IP address, subnet mask, gateway
             address and DNS server address.
         """
+        # The gateway, subnet mask and IP address registers are in one block (with the
+        # MAC address between them on some chips), so read them in a single burst.
+        gateway = _REG_GAR[self._chip_type]
+        subnet_mask = _REG_SUBR[self._chip_type] - gateway
+        ip_address = _REG_SIPR[self._chip_type] - gateway
+        registers = self._read(gateway, 0x00, ip_address + 4)
         return (
-            self.ip_address,
-            self._read(_REG_SUBR[self._chip_type], 0x00, 4),
-            self._read(_REG_GAR[self._chip_type], 0x00, 4),
+            registers[ip_address : ip_address + 4],
+            registers[subnet_mask : subnet_mask + 4],
+            registers[:4],
             self._dns,
         )
 
@@ -486,9 +641,10 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
                 raise ValueError("IPv4 address must be 4 bytes.")
         ip_address, subnet_mask, gateway_address, dns_server = params
 
-        self._write(_REG_SIPR[self._chip_type], 0x04, bytes(ip_address))
-        self._write(_REG_SUBR[self._chip_type], 0x04, bytes(subnet_mask))
-        self._write(_REG_GAR[self._chip_type], 0x04, bytes(gateway_address))
+        with self.batch():
+            self._write(_REG_SIPR[self._chip_type], 0x04, bytes(ip_address))
+            self._write(_REG_SUBR[self._chip_type], 0x04, bytes(subnet_mask))
+            self._write(_REG_GAR[self._chip_type], 0x04, bytes(gateway_address))
 
         self._dns = bytes(dns_server)
 
@@ -569,18 +725,19 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         # initialize a socket and set the mode
         self.socket_open(socket_num, conn_mode=conn_mode)
         # set socket destination IP and port
-        self._write_sndipr(socket_num, dest)
-        self._write_sndport(socket_num, port)
-        self._write_sncr(socket_num, _CMD_SOCK_CONNECT)
+        with self.batch():
+            self._chip_socket_destination(socket_num, dest, port)
+            self._write_sncr(socket_num, _CMD_SOCK_CONNECT)
 
         if conn_mode == _SNMR_TCP:
             # wait for tcp connection establishment
-            while self.socket_status(socket_num) != SNSR_SOCK_ESTABLISHED:
+            status = self.socket_status(socket_num)
+            while status != SNSR_SOCK_ESTABLISHED:
                 time.sleep(0.001)
-                debug_msg(
-                    "SNSR: {}".format(self.socket_status(socket_num)), self._debug
-                )
-                if self.socket_status(socket_num) == SNSR_SOCK_CLOSED:
+                status = self.socket_status(socket_num)
+                if self._debug:
+                    debug_msg("SNSR: {}".format(status), self._debug)
+                if status == SNSR_SOCK_CLOSED:
                     raise ConnectionError("Failed to establish connection.")
         return 1
 
@@ -617,15 +774,25 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
             "Reserved sockets: {}".format(WIZNET5K._sockets_reserved), self._debug
         )
 
-        for socket_number, reserved in enumerate(WIZNET5K._sockets_reserved, start=1):
-            if not reserved and self.socket_status(socket_number) == SNSR_SOCK_CLOSED:
-                if reserve_socket:
-                    WIZNET5K._sockets_reserved[socket_number - 1] = True
-                    debug_msg(
-                        "Allocated socket # {}.".format(socket_number),
-                        self._debug,
-                    )
-                return socket_number
+        # Check the sockets known to be closed first, then the others in case the
+        # chip has closed them, so that open sockets are only polled as a fallback.
+        free_mask = self._sock_free_mask
+        for check_mask in (free_mask, ~free_mask):
+            for socket_number, reserved in enumerate(
+                WIZNET5K._sockets_reserved, start=1
+            ):
+                if (
+                    not reserved
+                    and check_mask & 1 << socket_number
+                    and self.socket_status(socket_number) == SNSR_SOCK_CLOSED
+                ):
+                    if reserve_socket:
+                        WIZNET5K._sockets_reserved[socket_number - 1] = True
+                        debug_msg(
+                            "Allocated socket # {}.".format(socket_number),
+                            self._debug,
+                        )
+                    return socket_number
         raise RuntimeError("All sockets in use.")
 
     def release_socket(self, socket_number):
@@ -670,11 +837,7 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         self._write_sncr(socket_num, _CMD_SOCK_LISTEN)
         # Wait until ready
         status = SNSR_SOCK_CLOSED
-        while status not in (
-            SNSR_SOCK_LISTEN,
-            SNSR_SOCK_ESTABLISHED,
-            _SNSR_SOCK_UDP,
-        ):
+        while status not in _SNSR_LISTEN_READY:
             status = self._read_snsr(socket_num)
             if status == SNSR_SOCK_CLOSED:
                 raise RuntimeError("Listening socket closed.")
@@ -734,23 +897,24 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         debug_msg("* Opening W5k Socket, protocol={}".format(conn_mode), self._debug)
         time.sleep(0.00025)
 
-        self._write_snmr(socket_num, conn_mode)
-        self.write_snir(socket_num, 0xFF)
-
         if self.src_port > 0:
-            # write to socket source port
-            self._write_sock_port(socket_num, self.src_port)
+            s_port = self.src_port
         else:
             s_port = randint(49152, 65535)
             while s_port in self._src_ports_in_use:
                 s_port = randint(49152, 65535)
-            self._write_sock_port(socket_num, s_port)
             self._src_ports_in_use[socket_num] = s_port
 
-        # open socket
-        self._write_sncr(socket_num, _CMD_SOCK_OPEN)
-        if self._read_snsr(socket_num) not in [_SNSR_SOCK_INIT, _SNSR_SOCK_UDP]:
-            raise RuntimeError("Could not open socket in TCP or UDP mode.")
+        with self.batch():
+            # set the mode, clear interrupts and write the socket source port
+            self._chip_socket_setup(socket_num, conn_mode, s_port)
+            # open socket
+            self._write_sncr(socket_num, _CMD_SOCK_OPEN)
+            self._rx_pending[socket_num] = 0
+            self._tx_pending[socket_num] = 0
+            if self._read_snsr(socket_num) not in [_SNSR_SOCK_INIT, _SNSR_SOCK_UDP]:
+                raise RuntimeError("Could not open socket in TCP or UDP mode.")
+        self._sock_free_mask &= ~(1 << socket_num)
 
     def socket_close(self, socket_num: int) -> None:
         """
@@ -759,10 +923,21 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         :param int socket_num: The socket to close.
 
         :raises ValueError: If the socket number is out of range.
+        :raises RuntimeError: If data waiting to be sent cannot be sent, the socket is
+            still closed.
         """
         debug_msg("*** Closing socket {}".format(socket_num), self._debug)
         self._sock_num_in_range(socket_num)
+        try:
+            self._send_before_close(socket_num)
+        finally:
+            self._close_socket(socket_num)
+
+    def _close_socket(self, socket_num: int) -> None:
+        """Close a socket and wait for the chip to report it closed."""
         self._write_sncr(socket_num, _CMD_SOCK_CLOSE)
+        self._rx_pending[socket_num] = 0
+        self._tx_pending[socket_num] = 0
         debug_msg("  Waiting for socket to close…", self._debug)
         timeout = time.monotonic() + 5.0
         while self._read_snsr(socket_num) != SNSR_SOCK_CLOSED:
@@ -773,6 +948,9 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
                     )
                 )
             time.sleep(0.0001)
+        # Clear any pending interrupts, a stale DISCON would hold INT low.
+        self.write_snir(socket_num, 0xFF)
+        self._sock_free_mask |= 1 << socket_num
         debug_msg("  Socket has closed.", self._debug)
 
     def socket_disconnect(self, socket_num: int) -> None:
@@ -782,11 +960,21 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         :param int socket_num: The socket to close.
 
         :raises ValueError: If the socket number is out of range.
+        :raises RuntimeError: If data waiting to be sent cannot be sent.
         """
         debug_msg("*** Disconnecting socket {}".format(socket_num), self._debug)
         self._sock_num_in_range(socket_num)
+        self._send_before_close(socket_num)
         self._write_sncr(socket_num, _CMD_SOCK_DISCON)
 
+    def _send_before_close(self, socket_num: int) -> None:
+        """Send data from flush=False writes so that it goes out before the FIN."""
+        if (
+            self._tx_pending[socket_num]
+            and self._read_snsr(socket_num) in _SNSR_WRITABLE
+        ):
+            self._send_pending(socket_num, time.monotonic() + 5.0)
+
     def socket_read(self, socket_num: int, length: int) -> Tuple[int, bytes]:
         """
         Read data from a hardware socket. Called directly by TCP socket objects and via
@@ -799,29 +987,64 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
             item of the tuple is the length of the data and the second is the data.
             If the read was unsuccessful then 0, b"" is returned.
 
+        :raises ValueError: If the socket number is out of range.
+        :raises ConnectionError: If the Ethernet link is down.
+        :raises RuntimeError: If the socket connection has been lost.
+        """
+        # The register reads made by socket_read_into are complete before the
+        # data is read into _rxbuf, so it can be shared with _read.
+        bytes_read = self.socket_read_into(socket_num, self._rxbuf, length)
+        return bytes_read, bytes(memoryview(self._rxbuf)[:bytes_read])
+
+    def socket_read_into(
+        self, socket_num: int, buffer: WriteableBuffer, length: Optional[int] = None
+    ) -> int:
+        """
+        Read data from a hardware socket into a buffer rather than creating a new
+        bytes object.
+
+        :param int socket_num: The socket to read data from.
+        :param WriteableBuffer buffer: The buffer to read the data into.
+        :param Optional[int] length: The maximum number of bytes to read from the
+            socket, defaults to None which reads up to the length of the buffer.
+
+        :return int: The number of bytes read, 0 if no data was available.
+
         :raises ValueError: If the socket number is out of range.
         :raises ConnectionError: If the Ethernet link is down.
         :raises RuntimeError: If the socket connection has been lost.
         """
         self._sock_num_in_range(socket_num)
         self._check_link_status()
+        if length is None or length > len(buffer):
+            length = len(buffer)
 
         # Check if there is data available on the socket
         bytes_on_socket = self._get_rx_rcv_size(socket_num)
         debug_msg("Bytes avail. on sock: {}".format(bytes_on_socket), self._debug)
         if bytes_on_socket:
-            bytes_on_socket = length if bytes_on_socket > length else bytes_on_socket
-            debug_msg(
-                "* Processing {} bytes of data".format(bytes_on_socket), self._debug
-            )
-            # Read the starting save address of the received data.
+            bytes_read = length if bytes_on_socket > length else bytes_on_socket
+            debug_msg("* Processing {} bytes of data".format(bytes_read), self._debug)
+            # Read the starting save address of the received data, skipping data
+            # which has already been read but not released to the chip.
             pointer = self._read_snrx_rd(socket_num)
+            pending = self._rx_pending[socket_num]
             # Read data from the hardware socket.
-            bytes_read = self._chip_socket_read(socket_num, pointer, bytes_on_socket)
-            # After reading the received data, update Sn_RX_RD register.
-            pointer = (pointer + bytes_on_socket) & 0xFFFF
-            self._write_snrx_rd(socket_num, pointer)
-            self._write_sncr(socket_num, _CMD_SOCK_RECV)
+            self._chip_socket_read(
+                socket_num,
+                (pointer + pending) & 0xFFFF,
+                memoryview(buffer)[:bytes_read],
+            )
+            pending += bytes_read
+            # Only update the Sn_RX_RD register and issue RECV once all the received
+            # data has been read or the socket buffer is filling up, so that small
+            # reads don't each cost a chip command.
+            if bytes_read == bytes_on_socket or pending >= _RX_RELEASE_SIZE:
+                self._write_snrx_rd(socket_num, (pointer + pending) & 0xFFFF)
+                self._write_sncr(socket_num, _CMD_SOCK_RECV)
+                pending = 0
+            self._rx_pending[socket_num] = pending
+            bytes_on_socket = bytes_read
         else:
             # no data on socket
             if self._read_snmr(socket_num) in (
@@ -830,8 +1053,7 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
                 SNSR_SOCK_CLOSE_WAIT,
             ):
                 raise RuntimeError("Lost connection to peer.")
-            bytes_read = b""
-        return bytes_on_socket, bytes_read
+        return bytes_on_socket
 
     def read_udp(self, socket_num: int, length: int) -> Tuple[int, bytes]:
         """
@@ -867,17 +1089,30 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         return bytes_on_socket, bytes_read
 
     def socket_write(
-        self, socket_num: int, buffer: bytearray, timeout: float = 0.0
+        self,
+        socket_num: int,
+        buffer: bytearray,
+        timeout: float = 0.0,
+        flush: bool = True,
     ) -> int:
         """
         Write data to a socket.
 
+        With flush=False the data is copied to the chip's TX buffer but not sent
+        until socket_flush() is called or 3/4 of the buffer is waiting, so that many
+        small writes can be sent together. socket_disconnect() and socket_close() send
+        any data still waiting on a connected TCP socket first. On UDP sockets all the
+        data written before it is sent forms a single datagram, and data still waiting
+        when the socket is closed is discarded.
+
         :param int socket_num: The socket to write to.
         :param bytearray buffer: The data to write to the socket.
         :param float timeout: Write data timeout in seconds, defaults to 0.0 which waits
             indefinitely.
+        :param bool flush: Send the data immediately, defaults to True.
 
-        :return int: The number of bytes written to the socket.
+        :return int: The number of bytes written to the socket, 0 if a UDP send timed
+            out. Data from earlier flush=False writes is lost when this happens.
 
         :raises ConnectionError: If the Ethernet link is down.
         :raises ValueError: If the socket number is out of range.
@@ -889,49 +1124,132 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
             bytes_to_write = _SOCK_SIZE
         else:
             bytes_to_write = len(buffer)
-        stop_time = time.monotonic() + timeout
-
+        # The timeout covers the whole write, including any sends it makes.
+        stop_time = time.monotonic() + timeout if timeout else None
+
+        # Data written but not yet sent is still using space in the TX buffer.
+        free_size = self._get_tx_free_size(socket_num) - self._tx_pending[socket_num]
+        if free_size < bytes_to_write and self._tx_pending[socket_num]:
+            if not self._send_pending(socket_num, stop_time):
+                return 0
+            free_size = self._get_tx_free_size(socket_num)
         # If buffer is available, start the transfer
-        free_size = self._get_tx_free_size(socket_num)
+        delay = 0.001
         while free_size < bytes_to_write:
-            free_size = self._get_tx_free_size(socket_num)
             status = self.socket_status(socket_num)
-            if status not in (SNSR_SOCK_ESTABLISHED, SNSR_SOCK_CLOSE_WAIT) or (
-                timeout and time.monotonic() > stop_time
+            if status not in _SNSR_WRITABLE or (
+                stop_time is not None and time.monotonic() > stop_time
             ):
                 raise RuntimeError("Unable to write data to the socket.")
+            # Give the chip time to send data before polling the free size again.
+            time.sleep(delay)
+            delay = min(delay * 2, 0.01)
+            free_size = self._get_tx_free_size(socket_num)
 
-        # Read the starting address for saving the transmitting data.
-        pointer = self._read_sntx_wr(socket_num)
-        offset = pointer & _SOCK_MASK
+        # Read the starting address for saving the transmitting data, following
+        # any data which has not been sent yet.
+        tx_wr = self._read_sntx_wr(socket_num)
+        offset = (tx_wr + self._tx_pending[socket_num]) & _SOCK_MASK
         self._chip_socket_write(socket_num, offset, bytes_to_write, buffer)
+        self._tx_pending[socket_num] += bytes_to_write
+        if flush or self._tx_pending[socket_num] >= _TX_FLUSH_SIZE:
+            if not self._send_pending(socket_num, stop_time, tx_wr):
+                return 0
+        return bytes_to_write
+
+    def socket_flush(self, socket_num: int, timeout: float = 0.0) -> int:
+        """
+        Send data written to a socket by socket_write() with flush=False.
+
+        :param int socket_num: The socket to send the data from.
+        :param float timeout: Send data timeout in seconds, defaults to 0.0 which waits
+            indefinitely.
+
+        :return int: The number of bytes sent, 0 if there was no data to send or a
+            UDP send timed out.
+
+        :raises ValueError: If the socket number is out of range.
+        :raises RuntimeError: If the data cannot be sent.
+        """
+        self._sock_num_in_range(socket_num)
+        return self._send_pending(
+            socket_num, time.monotonic() + timeout if timeout else None
+        )
+
+    def _send_pending(
+        self, socket_num: int, stop_time: Optional[float], tx_wr: Optional[int] = None
+    ) -> int:
+        """
+        Send the data waiting in a socket's TX buffer and wait for it to be sent.
+
+        :param int socket_num: The socket to send the data from.
+        :param Optional[float] stop_time: Time to give up waiting for the data to be
+            sent, None to wait indefinitely.
+        :param Optional[int] tx_wr: The current Sn_TX_WR value if the caller has
+            already read it, defaults to None which reads it from the chip.
+
+        :return int: The number of bytes sent, 0 if there was no data to send or a
+            UDP send timed out.
+
+        :raises RuntimeError: If the data cannot be sent.
+        """
+        bytes_to_send = self._tx_pending[socket_num]
+        if not bytes_to_send:
+            return 0
+        self._tx_pending[socket_num] = 0
+        if tx_wr is None:
+            tx_wr = self._read_sntx_wr(socket_num)
+
         # update sn_tx_wr to the value + data size
-        pointer = (pointer + bytes_to_write) & 0xFFFF
+        pointer = (tx_wr + bytes_to_send) & 0xFFFF
         self._write_sntx_wr(socket_num, pointer)
         self._write_sncr(socket_num, _CMD_SOCK_SEND)
 
         # check data was  transferred correctly
-        while not self.read_snir(socket_num) & _SNIR_SEND_OK:
-            if self.socket_status(socket_num) in (
-                SNSR_SOCK_CLOSED,
-                SNSR_SOCK_TIME_WAIT,
-                SNSR_SOCK_FIN_WAIT,
-                SNSR_SOCK_CLOSE_WAIT,
-                _SNSR_SOCK_CLOSING,
-            ):
+        delay = 0.0001
+        snir = self.read_snir(socket_num)
+        while not snir & _SNIR_SEND_OK:
+            if self.socket_status(socket_num) in _SNSR_SEND_CLOSED:
                 raise RuntimeError("No data was sent, socket was closed.")
-            if timeout and time.monotonic() > stop_time:
+            if stop_time is not None and time.monotonic() > stop_time:
                 raise RuntimeError("Operation timed out. No data sent.")
-            if self.read_snir(socket_num) & SNIR_TIMEOUT:
+            if snir & SNIR_TIMEOUT:
                 self.write_snir(socket_num, SNIR_TIMEOUT)
                 # TCP sockets are closed by the hardware timeout
                 # so that will be caught at the while statement.
                 # UDP sockets are 1:many so not closed thus return 0.
                 if self._read_snmr(socket_num) == SNMR_UDP:
                     return 0
-            time.sleep(0.001)
+            delay = self._wait_for_interrupt(delay)
+            snir = self.read_snir(socket_num)
         self.write_snir(socket_num, _SNIR_SEND_OK)
-        return bytes_to_write
+        return bytes_to_send
+
+    def _wait_for_interrupt(self, delay: float) -> float:
+        """
+        Wait before polling a socket interrupt register again.
+
+        If an interrupt pin is connected and not yet asserted, wait for the chip to
+        assert it without sleeping. The wait gives up after 5ms so that a pin which
+        never goes low cannot stop the caller polling. Otherwise sleep for delay
+        seconds.
+
+        :param float delay: Time to sleep in seconds if the pin is not waited on.
+
+        :return float: The delay to use for the next wait, doubling up to 5ms.
+        """
+        irq = self._irq
+        if irq and irq.value:
+            # INT is active low while any unmasked socket interrupt is pending. Use
+            # integer nanoseconds, a float monotonic() loses resolution with uptime.
+            deadline = time.monotonic_ns() + _IRQ_WAIT_NS
+            while irq.value and time.monotonic_ns() < deadline:
+                pass
+            return delay
+        # No pin, or INT is already held low by an interrupt pending on this or
+        # another socket, so back off between polls.
+        time.sleep(delay)
+        return min(delay * 2, 0.005)
 
     def sw_reset(self) -> None:
         """
@@ -939,6 +1257,7 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
 
         :raises RuntimeError: If reset fails.
         """
+        self._link_up_time = None
         self._wiznet_chip_init()
 
     def _sw_reset_5x00(self) -> bool:
@@ -951,22 +1270,39 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         time.sleep(0.05)
         return self._read_mr() == {"w5500": 0x00, "w5100s": 0x03}[self._chip_type]
 
-    def _wiznet_chip_init(self) -> None:
+    def _wiznet_chip_init(self) -> None:  # pylint: disable=too-many-statements
         """
         Detect and initialize a WIZnet 5k Ethernet module.
 
         :raises RuntimeError: If no WIZnet chip is detected.
         """
 
+        def _setup_socket_addressing() -> None:
+            """Cache the register base address and control bytes for each socket."""
+            sockets = range(_MAX_SOCK_NUM[self._chip_type])
+            if self._chip_type == "w5100s":
+                self._sock_base = tuple(
+                    self._ch_base_msb + sock * _CH_SIZE for sock in sockets
+                )
+                self._sock_rctl = self._sock_wctl = (0,) * len(sockets)
+            else:
+                self._sock_base = (0,) * len(sockets)
+                self._sock_rctl = tuple((sock << 5) + 0x08 for sock in sockets)
+                self._sock_wctl = tuple((sock << 5) + 0x0C for sock in sockets)
+
         def _setup_sockets() -> None:
             """Initialise sockets for w5500 and w6100 chips."""
-            for sock_num in range(_MAX_SOCK_NUM[self._chip_type]):
-                ctrl_byte = 0x0C + (sock_num << 5)
-                self._write(0x1E, ctrl_byte, 2)
-                self._write(0x1F, ctrl_byte, 2)
             self._ch_base_msb = 0x00
+            _setup_socket_addressing()
+            with self.batch():
+                for sock_num in range(_MAX_SOCK_NUM[self._chip_type]):
+                    # Set the adjacent RX (0x1E) and TX (0x1F) buffer sizes to 2kB.
+                    self._write_socket_registers(sock_num, 0x1E, b"\x02\x02")
             WIZNET5K._sockets_reserved = [False] * (_MAX_SOCK_NUM[self._chip_type] - 1)
             self._src_ports_in_use = [0] * _MAX_SOCK_NUM[self._chip_type]
+            self._rx_pending = [0] * _MAX_SOCK_NUM[self._chip_type]
+            self._tx_pending = [0] * _MAX_SOCK_NUM[self._chip_type]
+            self._sock_free_mask = (1 << _MAX_SOCK_NUM[self._chip_type]) - 1
 
         def _detect_and_reset_w6100() -> bool:
             """
@@ -983,7 +1319,7 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
             self._write(0x2004, 0x04, 0x00)  # Reset chip.
             time.sleep(0.05)  # Wait for reset.
 
-            if self._read(_REG_VERSIONR[self._chip_type], 0x00)[0] != 0x61:
+            if self._read_byte(_REG_VERSIONR[self._chip_type], 0x00) != 0x61:
                 return False
             # Initialize w6100.
             self._write(0x41F5, 0x04, 0x3A)  # Unlock network settings.
@@ -1013,7 +1349,7 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
             if self._read_mr() != 0x00:
                 return False
 
-            if self._read(_REG_VERSIONR[self._chip_type], 0x00)[0] != 0x04:
+            if self._read_byte(_REG_VERSIONR[self._chip_type], 0x00) != 0x04:
                 return False
             # Initialize w5500
             _setup_sockets()
@@ -1030,13 +1366,17 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
             if not self._sw_reset_5x00():
                 return False
 
-            if self._read(_REG_VERSIONR[self._chip_type], 0x00)[0] != 0x51:
+            if self._read_byte(_REG_VERSIONR[self._chip_type], 0x00) != 0x51:
                 return False
 
             # Initialise w5100s
             self._ch_base_msb = 0x0400
+            _setup_socket_addressing()
             WIZNET5K._sockets_reserved = [False] * (_MAX_SOCK_NUM[self._chip_type] - 1)
             self._src_ports_in_use = [0] * _MAX_SOCK_NUM[self._chip_type]
+            self._rx_pending = [0] * _MAX_SOCK_NUM[self._chip_type]
+            self._tx_pending = [0] * _MAX_SOCK_NUM[self._chip_type]
+            self._sock_free_mask = (1 << _MAX_SOCK_NUM[self._chip_type]) - 1
             return True
 
         for func in [
@@ -1045,17 +1385,38 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
             _detect_and_reset_w6100,
         ]:
             if func():
+                if self._irq:
+                    self._setup_interrupts()
                 return
         self._chip_type = None
         raise RuntimeError("Failed to initialize WIZnet module.")
 
+    def _setup_interrupts(self) -> None:
+        """Route the socket send, timeout and disconnect interrupts to the INT pin."""
+        with self.batch():
+            for sock_num in range(self.max_sockets):
+                self._write_socket_register(
+                    sock_num,
+                    _REG_SNIMR[self._chip_type],
+                    _SNIR_SEND_OK | SNIR_TIMEOUT | SNIR_DISCON,
+                )
+            self._write(_REG_SIMR[self._chip_type], 0x04, (1 << self.max_sockets) - 1)
+
     def _sock_num_in_range(self, sock: int) -> None:
         """Check that the socket number is in the range 0 - maximum sockets."""
         if not 0 <= sock < self.max_sockets:
             raise ValueError("Socket number out of range.")
 
     def _check_link_status(self):
-        """Raise an exception if the link is down."""
+        """
+        Raise an exception if the link is down. The link is not read again if it was
+        up less than _LINK_STATUS_TIMEOUT seconds ago.
+        """
+        if (
+            self._link_up_time is not None
+            and time.monotonic() - self._link_up_time < _LINK_STATUS_TIMEOUT
+        ):
+            return
         if not self.link_status:
             raise ConnectionError("The Ethernet connection is down.")
 
@@ -1066,7 +1427,7 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
 
     def _read_mr(self) -> int:
         """Read from the Mode Register (MR)."""
-        return int.from_bytes(self._read(_REG_MR[self._chip_type], 0x00), "big")
+        return self._read_byte(_REG_MR[self._chip_type], 0x00)
 
     def _write_mr(self, data: int) -> None:
         """Write to the mode register (MR)."""
@@ -1089,64 +1450,110 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
 
         :return bytes: Data read from the chip.
         """
-        with self._device as bus_device:
-            self._chip_read(bus_device, addr, callback)
+        if length > len(self._rxbuf):
             self._rxbuf = bytearray(length)
-            bus_device.readinto(self._rxbuf)
-            return bytes(self._rxbuf)
+        self._chip_read(addr, callback)
+        with self._spi_frame as bus_device:
+            bus_device.write(self._cmd_buf, end=3)
+            bus_device.readinto(self._rxbuf, end=length)
+        return bytes(memoryview(self._rxbuf)[:length])
+
+    def _read_into(self, addr: int, callback: int, buffer: WriteableBuffer) -> None:
+        """
+        Read data from a register address into a buffer, filling the buffer.
+
+        :param int addr: Register address to read.
+        :param int callback: Callback reference.
+        :param WriteableBuffer buffer: Buffer to read the data into.
+        """
+        self._chip_read(addr, callback)
+        with self._spi_frame as bus_device:
+            bus_device.write(self._cmd_buf, end=3)
+            bus_device.readinto(buffer)
+
+    def _read_byte(self, addr: int, callback: int) -> int:
+        """
+        Read a single byte register without allocating a new buffer.
+
+        :param int addr: Register address to read.
+        :param int callback: Callback reference.
+
+        :return int: The register value.
+        """
+        self._chip_read(addr, callback)
+        with self._spi_frame as bus_device:
+            bus_device.write(self._cmd_buf, end=3)
+            bus_device.readinto(self._buf1)
+        return self._buf1[0]
 
-    def _write(self, addr: int, callback: int, data: Union[int, bytes]) -> None:
+    def _write(
+        self, addr: int, callback: int, data: Union[int, bytes, bytearray, memoryview]
+    ) -> None:
         """
         Write data to a register address.
 
         :param int addr: Destination address.
         :param int callback: Callback reference.
-        :param Union[int, bytes] data: Data to write to the register address, if data
-            is an integer, it must be 1 or 2 bytes.
+        :param Union[int, bytes, bytearray, memoryview] data: Data to write to the
+            register address, if data is an integer, it must be 1 or 2 bytes. Buffers
+            are sent in a single transfer.
 
         :raises OverflowError: if integer data is more than 2 bytes.
         """
-        with self._device as bus_device:
-            self._chip_write(bus_device, addr, callback)
-            try:
-                data = data.to_bytes(1, "big")
-            except OverflowError:
+        self._chip_write(addr, callback)
+        with self._spi_frame as bus_device:
+            if isinstance(data, int):
+                if data <= 0xFF:
+                    # Send a single byte of data in the same write as the header.
+                    self._cmd_buf[3] = data
+                    bus_device.write(self._cmd_buf)
+                    return
                 data = data.to_bytes(2, "big")
-            except AttributeError:
-                pass
+            bus_device.write(self._cmd_buf, end=3)
             bus_device.write(data)
 
     def _read_two_byte_sock_reg(self, sock: int, reg_address: int) -> int:
         """Read a two byte socket register."""
-        register = self._read_socket_register(sock, reg_address) << 8
-        register += self._read_socket_register(sock, reg_address + 1)
-        return register
+        self._read_socket_registers(sock, reg_address, self._buf2)
+        return self._buf2[0] << 8 | self._buf2[1]
 
     def _write_two_byte_sock_reg(self, sock: int, reg_address: int, data: int) -> None:
         """Write to a two byte socket register."""
-        self._write_socket_register(sock, reg_address, data >> 8 & 0xFF)
-        self._write_socket_register(sock, reg_address + 1, data & 0xFF)
+        self._buf2[0] = data >> 8 & 0xFF
+        self._buf2[1] = data & 0xFF
+        self._write_socket_registers(sock, reg_address, self._buf2)
 
     # *** Socket Register Methods ***
 
     def _get_rx_rcv_size(self, sock: int) -> int:
-        """Size of received and saved in socket buffer."""
-        val = 0
-        val_1 = self._read_snrx_rsr(sock)
-        while val != val_1:
-            val_1 = self._read_snrx_rsr(sock)
-            if val_1 != 0:
-                val = self._read_snrx_rsr(sock)
-        return val
+        """Size of received and saved in socket buffer, less data already read."""
+        return (
+            self._read_until_stable(sock, _REG_SNRX_RSR[self._chip_type])
+            - self._rx_pending[sock]
+        )
 
     def _get_tx_free_size(self, sock: int) -> int:
         """Free size of socket's tx buffer block."""
-        val = 0
-        val_1 = self._read_sntx_fsr(sock)
-        while val != val_1:
-            val_1 = self._read_sntx_fsr(sock)
-            if val_1 != 0:
-                val = self._read_sntx_fsr(sock)
+        return self._read_until_stable(sock, _REG_SNTX_FSR[self._chip_type])
+
+    def _read_until_stable(self, sock: int, address: int) -> int:
+        """
+        Read a two byte socket size register which the chip may update while it is
+        being read.
+
+        A zero is returned at once, otherwise the register is read until two
+        consecutive reads agree, backing off exponentially between reads which
+        do not agree.
+        """
+        delay = 0.0001
+        val = self._read_two_byte_sock_reg(sock, address)
+        while val:
+            val_1 = self._read_two_byte_sock_reg(sock, address)
+            if val_1 == val:
+                break
+            val = val_1
+            time.sleep(delay)
+            delay = min(delay * 4, 0.01)
         return val
 
     def _read_snrx_rd(self, sock: int) -> int:
@@ -1175,19 +1582,12 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
 
     def _read_sndipr(self, sock) -> bytes:
         """Read socket destination IP address."""
-        data = []
-        for offset in range(4):
-            data.append(
-                self._read_socket_register(sock, _REG_SNDIPR[self._chip_type] + offset)
-            )
-        return bytes(data)
+        self._read_socket_registers(sock, _REG_SNDIPR[self._chip_type], self._buf4)
+        return bytes(self._buf4)
 
     def _write_sndipr(self, sock: int, ip_addr: bytes) -> None:
         """Write to socket destination IP Address."""
-        for offset, value in enumerate(ip_addr):
-            self._write_socket_register(
-                sock, _REG_SNDIPR[self._chip_type] + offset, value
-            )
+        self._write_socket_registers(sock, _REG_SNDIPR[self._chip_type], bytes(ip_addr))
 
     def _read_sndport(self, sock: int) -> int:
         """Read socket destination port."""
@@ -1206,8 +1606,12 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
         return self._read_socket_register(sock, _REG_SNIR[self._chip_type])
 
     def write_snir(self, sock: int, data: int) -> None:
-        """Write to Socket n Interrupt Register."""
-        self._write_socket_register(sock, _REG_SNIR[self._chip_type], data)
+        """
+        Clear the Socket n Interrupt Register bits set in data.
+
+        The W6100 Sn_IR is read only, so its bits are cleared through Sn_IRCLR.
+        """
+        self._write_socket_register(sock, _REG_SNIRCLR[self._chip_type], data)
 
     def _read_snmr(self, sock: int) -> int:
         """Read the socket MR register."""
@@ -1231,7 +1635,7 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
     @property
     def rcr(self) -> int:
         """Retry count register."""
-        return int.from_bytes(self._read(_REG_RCR[self._chip_type], 0x00), "big")
+        return self._read_byte(_REG_RCR[self._chip_type], 0x00)
 
     @rcr.setter
     def rcr(self, retry_count: int) -> None:
@@ -1254,51 +1658,45 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
 
     # *** Chip Specific Methods ***
 
-    def _chip_read(self, device: "busio.SPI", address: int, call_back: int) -> None:
-        """Chip specific calls for _read method."""
+    def _chip_read(self, address: int, call_back: int) -> None:
+        """Chip specific SPI frame header for the _read method."""
         if self._chip_type in ("w5500", "w6100"):
-            device.write((address >> 8).to_bytes(1, "big"))
-            device.write((address & 0xFF).to_bytes(1, "big"))
-            device.write(call_back.to_bytes(1, "big"))
+            struct.pack_into(">HB", self._cmd_buf, 0, address, call_back)
         elif self._chip_type == "w5100s":
-            device.write((0x0F).to_bytes(1, "big"))
-            device.write((address >> 8).to_bytes(1, "big"))
-            device.write((address & 0xFF).to_bytes(1, "big"))
+            struct.pack_into(">BH", self._cmd_buf, 0, 0x0F, address)
 
-    def _chip_write(self, device: "busio.SPI", address: int, call_back: int) -> None:
-        """Chip specific calls for _write."""
+    def _chip_write(self, address: int, call_back: int) -> None:
+        """Chip specific SPI frame header for the _write method."""
         if self._chip_type in ("w5500", "w6100"):
-            device.write((address >> 8).to_bytes(1, "big"))
-            device.write((address & 0xFF).to_bytes(1, "big"))
-            device.write(call_back.to_bytes(1, "big"))
+            struct.pack_into(">HB", self._cmd_buf, 0, address, call_back)
         elif self._chip_type == "w5100s":
-            device.write((0xF0).to_bytes(1, "big"))
-            device.write((address >> 8).to_bytes(1, "big"))
-            device.write((address & 0xFF).to_bytes(1, "big"))
+            struct.pack_into(">BH", self._cmd_buf, 0, 0xF0, address)
 
-    def _chip_socket_read(self, socket_number, pointer, bytes_to_read):
-        """Chip specific calls for socket_read."""
+    def _chip_socket_read(
+        self, socket_number: int, pointer: int, buffer: memoryview
+    ) -> None:
+        """Chip specific calls for socket_read_into, fills the whole buffer."""
         if self._chip_type in ("w5500", "w6100"):
             # Read data from the starting address of snrx_rd
             ctrl_byte = 0x18 + (socket_number << 5)
-            bytes_read = self._read(pointer, ctrl_byte, bytes_to_read)
+            self._read_into(pointer, ctrl_byte, buffer)
         elif self._chip_type == "w5100s":
             offset = pointer & _SOCK_MASK
             src_addr = offset + (socket_number * _SOCK_SIZE + 0x6000)
-            if offset + bytes_to_read > _SOCK_SIZE:
+            if offset + len(buffer) > _SOCK_SIZE:
                 split_point = _SOCK_SIZE - offset
-                bytes_read = self._read(src_addr, 0x00, split_point)
-                split_point = bytes_to_read - split_point
+                self._read_into(src_addr, 0x00, buffer[:split_point])
                 src_addr = socket_number * _SOCK_SIZE + 0x6000
-                bytes_read += self._read(src_addr, 0x00, split_point)
+                self._read_into(src_addr, 0x00, buffer[split_point:])
             else:
-                bytes_read = self._read(src_addr, 0x00, bytes_to_read)
-        return bytes_read
+                self._read_into(src_addr, 0x00, buffer)
 
     def _chip_socket_write(
         self, socket_number: int, offset: int, bytes_to_write: int, buffer: bytes
     ):
         """Chip specific calls for socket_write."""
+        # Slice a memoryview so the payload is not copied before it is sent.
+        buffer = memoryview(buffer)
         if self._chip_type in ("w5500", "w6100"):
             dst_addr = offset + (socket_number * _SOCK_SIZE + 0x8000)
             cntl_byte = 0x14 + (socket_number << 5)
@@ -1315,6 +1713,52 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
             else:
                 self._write(dst_addr, 0x00, buffer[:bytes_to_write])
 
+    def _chip_socket_setup(self, socket_num: int, conn_mode: int, port: int) -> None:
+        """
+        Chip specific calls to set the socket mode, clear the socket interrupts and
+        write the socket source port.
+
+        On the W5100S and W5500 these registers are contiguous so they are written in
+        one burst. The command register in the burst is written as zero (no command)
+        and the status register is read only.
+        """
+        if self._chip_type in ("w5100s", "w5500"):
+            data = self._buf6
+            data[0] = conn_mode
+            data[1] = 0x00
+            data[2] = 0xFF
+            data[3] = 0x00
+            data[4] = port >> 8
+            data[5] = port & 0xFF
+            self._write_socket_registers(socket_num, _REG_SNMR, data)
+        elif self._chip_type == "w6100":
+            self._write_snmr(socket_num, conn_mode)
+            self.write_snir(socket_num, 0xFF)
+            self._write_sock_port(socket_num, port)
+        else:
+            raise ValueError("Unsupported chip type.")
+
+    def _chip_socket_destination(
+        self, socket_num: int, dest: IpAddress4Raw, port: int
+    ) -> None:
+        """
+        Chip specific calls to write the socket destination IPv4 address and port.
+
+        On the W5100S and W5500 the destination port follows the destination address
+        so both are written in one burst.
+        """
+        if self._chip_type in ("w5100s", "w5500"):
+            data = self._buf6
+            data[:4] = bytes(dest)
+            data[4] = port >> 8
+            data[5] = port & 0xFF
+            self._write_socket_registers(socket_num, _REG_SNDIPR[self._chip_type], data)
+        elif self._chip_type == "w6100":
+            self._write_sndipr(socket_num, dest)
+            self._write_sndport(socket_num, port)
+        else:
+            raise ValueError("Unsupported chip type.")
+
     def _chip_parse_udp_header(self, socket_num) -> int:
         """
         Parse chip specific UDP header data for IPv4 packets.
@@ -1323,33 +1767,33 @@ class WIZNET5K:  # pylint: disable=too-many-public-methods, too-many-instance-at
 
         :return int: The UDP data length.
         """
+        header = self._pbuff
         if self._chip_type in ("w5100s", "w5500"):
-            self.udp_from_ip[socket_num] = self._pbuff[:4]
-            self.udp_from_port[socket_num] = int.from_bytes(self._pbuff[4:6], "big")
-            return int.from_bytes(self._pbuff[6:], "big")
+            self.udp_from_ip[socket_num] = header[:4]
+            self.udp_from_port[socket_num] = header[4] << 8 | header[5]
+            return header[6] << 8 | header[7]
         if self._chip_type == "w6100":
-            self.udp_from_ip[socket_num] = self._pbuff[3:7]
-            self.udp_from_port[socket_num] = int.from_bytes(self._pbuff[6:], "big")
-            return int.from_bytes(self._pbuff[:2], "big") & 0x07FF
+            self.udp_from_ip[socket_num] = header[3:7]
+            self.udp_from_port[socket_num] = header[6] << 8 | header[7]
+            return (header[0] << 8 | header[1]) & 0x07FF
         raise ValueError("Unsupported chip type.")
 
     def _write_socket_register(self, sock: int, address: int, data: int) -> None:
         """Write to a WIZnet 5k socket register."""
-        if self._chip_type in ("w5500", "w6100"):
-            cntl_byte = (sock << 5) + 0x0C
-            self._write(address, cntl_byte, data)
-        elif self._chip_type == "w5100s":
-            cntl_byte = 0
-            self._write(self._ch_base_msb + sock * _CH_SIZE + address, cntl_byte, data)
+        self._write_socket_registers(sock, address, data)
+
+    def _write_socket_registers(
+        self, sock: int, address: int, data: Union[int, bytes, bytearray]
+    ) -> None:
+        """Write to consecutive WIZnet 5k socket registers in a single burst."""
+        self._write(self._sock_base[sock] + address, self._sock_wctl[sock], data)
 
     def _read_socket_register(self, sock: int, address: int) -> int:
         """Read a WIZnet 5k socket register."""
-        if self._chip_type in ("w5500", "w6100"):
-            cntl_byte = (sock << 5) + 0x08
-            register = self._read(address, cntl_byte)
-        elif self._chip_type == "w5100s":
-            cntl_byte = 0
-            register = self._read(
-                self._ch_base_msb + sock * _CH_SIZE + address, cntl_byte
-            )
-        return int.from_bytes(register, "big")
+        return self._read_byte(self._sock_base[sock] + address, self._sock_rctl[sock])
+
+    def _read_socket_registers(
+        self, sock: int, address: int, buffer: WriteableBuffer
+    ) -> None:
+        """Read consecutive WIZnet 5k socket registers into a buffer in one burst."""
+        self._read_into(self._sock_base[sock] + address, self._sock_rctl[sock], buffer)
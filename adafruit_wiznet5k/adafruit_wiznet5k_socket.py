@@ -586,16 +586,17 @@ class socket:
                 last_read_time = time.monotonic()
                 bytes_to_read = min(num_to_read, num_avail)
                 if self._sock_type == SOCK_STREAM:
-                    bytes_read = _the_interface.socket_read(
-                        self._socknum, bytes_to_read
-                    )[1]
+                    num_bytes = _the_interface.socket_read_into(
+                        self._socknum, memoryview(buffer)[num_read:], bytes_to_read
+                    )
                 else:
                     bytes_read = _the_interface.read_udp(self._socknum, bytes_to_read)[
                         1
                     ]
-                buffer[num_read : num_read + len(bytes_read)] = bytes_read
-                num_read += len(bytes_read)
-                num_to_read -= len(bytes_read)
+                    num_bytes = len(bytes_read)
+                    buffer[num_read : num_read + num_bytes] = bytes_read
+                num_read += num_bytes
+                num_to_read -= num_bytes
             elif num_read > 0:
                 # We got a message, but there are no more bytes to read, so we can stop.
                 break